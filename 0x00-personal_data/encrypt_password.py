@@ -1,29 +1,72 @@
 #!/usr/bin/env python3
 """A module for encrypting and verifying passwords using bcrypt.
 """
+import os
 import bcrypt
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Union
 
 
-def hash_password(password: str) -> bytes:
+_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# bcrypt releases the GIL while hashing, so checks scale across threads
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def _to_bytes(password: Union[str, bytes]) -> bytes:
+    """Encodes a password to UTF-8 unless it is already bytes.
+
+    Args:
+        password (Union[str, bytes]): The plaintext password.
+
+    Returns:
+        bytes: The password as bytes.
+    """
+    if isinstance(password, bytes):
+        return password
+    if isinstance(password, bytearray):
+        return bytes(password)  # bcrypt only accepts bytes
+    return password.encode('utf-8')
+
+
+def hash_password(password: Union[str, bytes]) -> bytes:
     """Hashes a password with a randomly generated salt.
 
+    The salt cost is read once from the `BCRYPT_ROUNDS` environment
+    variable and defaults to 12.
+
     Args:
-        password (str): The plaintext password to hash.
+        password (Union[str, bytes]): The plaintext password to hash.
 
     Returns:
         bytes: The resulting hashed password in bytes, with the salt included.
     """
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+    return bcrypt.hashpw(_to_bytes(password), bcrypt.gensalt(_ROUNDS))
 
 
-def is_valid(hashed_password: bytes, password: str) -> bool:
+def is_valid(hashed_password: bytes, password: Union[str, bytes]) -> bool:
     """Verifies that a password matches its hashed version.
 
     Args:
         hashed_password (bytes): The hashed password to check against.
-        password (str): The plaintext password to verify.
+        password (Union[str, bytes]): The plaintext password to verify.
 
     Returns:
         bool: True if the password matches the hashed version; False otherwise.
     """
-    return bcrypt.checkpw(password.encode('utf-8'), hashed_password)
+    return bcrypt.checkpw(_to_bytes(password), hashed_password)
+
+
+def is_valid_async(
+        hashed_password: bytes, password: Union[str, bytes]) -> Future:
+    """Verifies a password against its hashed version on a worker thread.
+
+    Args:
+        hashed_password (bytes): The hashed password to check against.
+        password (Union[str, bytes]): The plaintext password to verify.
+
+    Returns:
+        Future: A future resolving to True if the password matches the
+            hashed version; False otherwise.
+    """
+    return _BCRYPT_POOL.submit(
+        bcrypt.checkpw, _to_bytes(password), hashed_password)
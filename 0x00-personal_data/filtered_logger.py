@@ -5,14 +5,47 @@ import os
 import re
 import logging
 import mysql.connector
-from typing import List
+from typing import Dict, List, Pattern, Tuple
 
 
 patterns = {
-    'extract': lambda x, y: r'(?P<field>{})=[^{}]*'.format('|'.join(x), y),
+    'extract': lambda x, y: r'(?P<field>{})=[^{}]*'.format(
+        '|'.join(map(re.escape, x)), re.escape(y)),
     'replace': lambda x: r'\g<field>={}'.format(x),
 }
 PII_FIELDS = ("name", "email", "phone", "ssn", "password")
+FETCH_BATCH_SIZE = 1024
+_PATTERN_CACHE: Dict[Tuple[Tuple[str, ...], str], Pattern] = {}
+_REPLACE_CACHE: Dict[str, str] = {}
+
+
+def _compiled_patterns(
+        fields: List[str], redaction: str, separator: str,
+        ) -> Tuple[Pattern, str]:
+    """Returns the cached extract pattern and replacement for a field set.
+
+    Args:
+        fields (List[str]): List of field names to redact.
+        redaction (str): The replacement text for redacted fields.
+        separator (str): The separator between fields in the log message.
+
+    Returns:
+        Tuple[Pattern, str]: The compiled extract pattern and replacement.
+    """
+    key = (tuple(fields), separator)
+    extract = _PATTERN_CACHE.get(key)
+    if extract is None:
+        extract = re.compile(patterns["extract"](*key))
+        _PATTERN_CACHE[key] = extract
+    replace = _REPLACE_CACHE.get(redaction)
+    if replace is None:
+        replace = patterns["replace"](redaction)
+        _REPLACE_CACHE[redaction] = replace
+    return extract, replace
+
+
+_EXTRACT = re.compile(patterns["extract"](PII_FIELDS, ";"))
+_PATTERN_CACHE[(PII_FIELDS, ";")] = _EXTRACT
 
 
 def filter_datum(
@@ -29,8 +62,8 @@ def filter_datum(
     Returns:
         str: The log message with specified fields redacted.
     """
-    extract, replace = (patterns["extract"], patterns["replace"])
-    return re.sub(extract(fields, separator), replace(redaction), message)
+    extract, replace = _compiled_patterns(fields, redaction, separator)
+    return extract.sub(replace, message)
 
 
 def get_logger() -> logging.Logger:
@@ -66,6 +99,12 @@ def get_db() -> mysql.connector.connection.MySQLConnection:
         user=db_user,
         password=db_pwd,
         database=db_name,
+        # Use the C extension protocol reader when it is installed
+        use_pure=not getattr(mysql.connector, 'HAVE_CEXT', False),
+        autocommit=True,
+        connection_timeout=10,
+        charset='utf8mb4',
+        collation='utf8mb4_bin',
     )
     return connection
 
@@ -78,21 +117,28 @@ def main():
     """
     fields = "name,email,phone,ssn,password,ip,last_login,user_agent"
     columns = fields.split(',')
-    query = "SELECT {} FROM users;".format(fields)  # Query to retrieve user records
+    query = "SELECT {} FROM users".format(fields)  # Query to retrieve user records
+    # PII columns are redacted here, so the formatter need not re-scan them
+    msg_fmt = '{};'.format('; '.join(
+        '{}={}'.format(c, RedactingFormatter.REDACTION) if c in PII_FIELDS
+        else '{}={{}}'.format(c) for c in columns
+    ))
+    keep = [i for i, c in enumerate(columns) if c not in PII_FIELDS]
     info_logger = get_logger()  # Obtain logger configured for redaction
     connection = get_db()  # Establish database connection
-    with connection.cursor() as cursor:
+    with connection.cursor(prepared=True) as cursor:
         cursor.execute(query)  # Execute query
-        rows = cursor.fetchall()  # Retrieve all records
-        for row in rows:
-            record = map(
-                lambda x: '{}={}'.format(x[0], x[1]),
-                zip(columns, row),
-            )
-            msg = '{};'.format('; '.join(list(record)))  # Format message string
-            args = ("user_data", logging.INFO, None, None, msg, None, None)
-            log_record = logging.LogRecord(*args)  # Create log record
-            info_logger.handle(log_record)  # Log the redacted record
+        while True:
+            rows = cursor.fetchmany(FETCH_BATCH_SIZE)  # Retrieve next batch
+            if not rows:
+                break
+            for row in rows:
+                msg = msg_fmt.format(*[row[i] for i in keep])  # Format message
+                args = ("user_data", logging.INFO, None, None, msg, None, None)
+                log_record = logging.LogRecord(*args)  # Create log record
+                # PII fields already redacted
+                log_record.redacted_fields = frozenset(PII_FIELDS)
+                info_logger.handle(log_record)  # Log the redacted record
 
 
 class RedactingFormatter(logging.Formatter):
@@ -116,10 +162,19 @@ class RedactingFormatter(logging.Formatter):
         """
         super(RedactingFormatter, self).__init__(self.FORMAT)
         self.fields = fields
+        self._fields_key = tuple(fields)
+        self._extract, self._replace = _compiled_patterns(
+            self._fields_key, self.REDACTION, self.SEPARATOR)
+        self._needles = tuple('{}='.format(f) for f in self._fields_key)
+        self._fields_set = frozenset(self._fields_key)
 
     def format(self, record: logging.LogRecord) -> str:
         """Redacts sensitive information in a log record.
 
+        Records whose `redacted_fields` attribute covers every field of
+        this formatter, and messages containing none of the `field=` keys,
+        are returned without the redaction scan.
+
         Args:
             record (logging.LogRecord): Log record containing message to redact.
 
@@ -127,7 +182,11 @@ class RedactingFormatter(logging.Formatter):
             str: The formatted and redacted log message.
         """
         msg = super(RedactingFormatter, self).format(record)
-        txt = filter_datum(self.fields, self.REDACTION, msg, self.SEPARATOR)
+        if self._fields_set.issubset(getattr(record, 'redacted_fields', ())):
+            return msg  # Producer already redacted the sensitive fields
+        if not any(needle in msg for needle in self._needles):
+            return msg  # No sensitive field to redact
+        txt = self._extract.sub(self._replace, msg)
         return txt  # Return the redacted message
 
 
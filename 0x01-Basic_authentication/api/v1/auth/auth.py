@@ -7,7 +7,7 @@ logic, such as checking if a path requires authentication, retrieving the
 authorization header, and identifying the current user.
 """
 import re
-from typing import List, TypeVar
+from typing import List, Tuple, TypeVar
 from flask import request
 
 
@@ -17,6 +17,41 @@ class Auth:
     Provides methods to check if a path requires authentication,
     retrieve the authorization header, and determine the current user.
     """
+    _excluded_paths = None
+    _exact_paths = frozenset()
+    _wildcard_re = None
+
+    @property
+    def excluded_paths(self) -> Tuple[str, ...]:
+        """
+        The paths that do not require authentication.
+        """
+        return self._excluded_paths
+
+    @excluded_paths.setter
+    def excluded_paths(self, value: List[str]) -> None:
+        """
+        Precompiles the excluded paths used by `require_auth`.
+
+        Args:
+            value (List[str]): A list of paths that do not require
+                authentication. Paths ending with `*` are matched as
+                prefixes.
+        """
+        exact_paths, wildcards = set(), []
+        for exclusion_path in map(lambda x: x.strip(), value or ()):
+            if not exclusion_path:
+                continue
+            if exclusion_path[-1] == '*':
+                wildcards.append(re.escape(exclusion_path[0:-1]))
+            else:
+                exact_paths.add(exclusion_path.rstrip('/'))
+        self._exact_paths = frozenset(exact_paths)
+        self._wildcard_re = None
+        if wildcards:
+            self._wildcard_re = re.compile('|'.join(wildcards))
+        self._excluded_paths = tuple(value or ())
+
     def require_auth(self, path: str, excluded_paths: List[str]) -> bool:
         """
         Determines if a given path requires authentication.
@@ -28,21 +63,15 @@ class Auth:
         Returns:
             bool: True if the path requires authentication, False otherwise.
         """
-        if path is not None and excluded_paths is not None:
-            # Check each excluded path for a match with the requested path
-            for exclusion_path in map(lambda x: x.strip(), excluded_paths):
-                pattern = ''
-                if exclusion_path[-1] == '*':
-                    # Match paths with wildcard support
-                    pattern = '{}.*'.format(exclusion_path[0:-1])
-                elif exclusion_path[-1] == '/':
-                    # Match paths ending with a slash
-                    pattern = '{}/*'.format(exclusion_path[0:-1])
-                else:
-                    # Match paths as is or with a trailing slash
-                    pattern = '{}/*'.format(exclusion_path)
-                if re.match(pattern, path):
-                    return False  # Path is excluded and does not require authentication
+        if path is None or excluded_paths is None:
+            return True
+        if excluded_paths is not self._excluded_paths and \
+                tuple(excluded_paths) != self._excluded_paths:
+            self.excluded_paths = excluded_paths
+        if path.rstrip('/') in self._exact_paths:
+            return False  # Path is excluded from authentication
+        if self._wildcard_re is not None and self._wildcard_re.match(path):
+            return False  # Path matches an excluded wildcard prefix
         return True  # Path requires authentication if no match is found
 
     def authorization_header(self, request=None) -> str:
@@ -5,15 +5,56 @@ Basic authentication module for the API.
 This module defines a `BasicAuth` class that extends the `Auth` class
 to implement Basic Authentication using the `Authorization` header.
 """
-import re
-import base64
 import binascii
+from functools import lru_cache
 from typing import Tuple, TypeVar
 
 from .auth import Auth
 from models.user import User
 
 
+@lru_cache(maxsize=1024)
+def _user_id_by_email(email: str) -> str:
+    """
+    Looks up the ID of the user registered with the given email.
+
+    Only successful lookups are cached: a missing user raises `LookupError`,
+    so the email is searched again on the next call.
+
+    Args:
+        email (str): The user's email address.
+
+    Returns:
+        str: The ID of the matching user.
+    """
+    users = User.search({'email': email})
+    if len(users) <= 0:
+        raise LookupError(email)
+    return users[0].id
+
+
+def _find_by_email(email: str) -> TypeVar('User'):
+    """
+    Retrieves the user registered with the given email.
+
+    Args:
+        email (str): The user's email address.
+
+    Returns:
+        User: The matching user object, or None if there is none.
+    """
+    try:
+        user = User.get(_user_id_by_email(email))
+    except LookupError:
+        return None
+    if user is None or getattr(user, 'email', None) != email:
+        # The cached ID is stale (user removed or email changed)
+        _user_id_by_email.cache_clear()
+        users = User.search({'email': email})
+        user = users[0] if len(users) > 0 else None
+    return user
+
+
 class BasicAuth(Auth):
     """Basic authentication class.
 
@@ -32,11 +73,10 @@ class BasicAuth(Auth):
         Returns:
             str: The Base64-encoded token if present, None otherwise.
         """
-        if type(authorization_header) == str:
-            pattern = r'Basic (?P<token>.+)'
-            field_match = re.fullmatch(pattern, authorization_header.strip())
-            if field_match is not None:
-                return field_match.group('token')
+        if isinstance(authorization_header, str):
+            header = authorization_header.strip()
+            if header.startswith('Basic ') and len(header) > 6:
+                return header[6:]
         return None
 
     def decode_base64_authorization_header(
@@ -51,14 +91,13 @@ class BasicAuth(Auth):
         Returns:
             str: The decoded string if successful, None otherwise.
         """
-        if type(base64_authorization_header) == str:
+        if isinstance(base64_authorization_header, str):
             try:
-                res = base64.b64decode(
-                    base64_authorization_header,
-                    validate=True,
-                )
+                token = base64_authorization_header.encode('ascii')
+                # Same checks as b64decode(validate=True), done in one pass
+                res = binascii.a2b_base64(token, strict_mode=True)
                 return res.decode('utf-8')
-            except (binascii.Error, UnicodeDecodeError):
+            except (binascii.Error, UnicodeError):
                 return None
 
     def extract_user_credentials(
@@ -74,15 +113,10 @@ class BasicAuth(Auth):
             Tuple[str, str]: A tuple containing the email and password, 
             or (None, None) if the token is invalid.
         """
-        if type(decoded_base64_authorization_header) == str:
-            pattern = r'(?P<user>[^:]+):(?P<password>.+)'
-            field_match = re.fullmatch(
-                pattern,
-                decoded_base64_authorization_header.strip(),
-            )
-            if field_match is not None:
-                user = field_match.group('user')
-                password = field_match.group('password')
+        if isinstance(decoded_base64_authorization_header, str):
+            user, sep, password = \
+                decoded_base64_authorization_header.strip().partition(':')
+            if sep and user and password:
                 return user, password
         return None, None
 
@@ -101,15 +135,17 @@ class BasicAuth(Auth):
             User: The authenticated user object if credentials are valid, 
             None otherwise.
         """
-        if type(user_email) == str and type(user_pwd) == str:
+        if isinstance(user_email, str) and isinstance(user_pwd, str):
+            if '@' not in user_email or len(user_email) > 254:
+                return None
             try:
-                users = User.search({'email': user_email})
+                user = _find_by_email(user_email)
             except Exception:
                 return None
-            if len(users) <= 0:
+            if user is None:
                 return None
-            if users[0].is_valid_password(user_pwd):
-                return users[0]
+            if user.is_valid_password(user_pwd):
+                return user
         return None
 
     def current_user(self, request=None) -> TypeVar('User'):
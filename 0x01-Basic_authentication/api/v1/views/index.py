@@ -5,9 +5,13 @@ Module of Index views.
 This module defines several routes to provide API status, statistics,
 and simulate error scenarios for unauthorized and forbidden access.
 """
-from flask import jsonify, abort
+import orjson
+from flask import Response, abort
 from api.v1.views import app_views
 
+# The status payload never changes, so it is serialized once at import
+_STATUS_BODY = orjson.dumps({"status": "OK"})
+
 
 @app_views.route('/status', methods=['GET'], strict_slashes=False)
 def status() -> str:
@@ -18,7 +22,7 @@ def status() -> str:
     Return:
         - JSON response with the status of the API.
     """
-    return jsonify({"status": "OK"})
+    return Response(_STATUS_BODY, mimetype='application/json')
 
 
 @app_views.route('/stats/', strict_slashes=False)
@@ -33,7 +37,7 @@ def stats() -> str:
     from models.user import User  # Importing User model dynamically
     stats = {}
     stats['users'] = User.count()  # Get the count of User objects
-    return jsonify(stats)
+    return Response(orjson.dumps(stats), mimetype='application/json')
 
 
 @app_views.route('/unauthorized/', strict_slashes=False)
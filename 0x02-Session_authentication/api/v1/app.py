@@ -6,9 +6,9 @@ This module initializes the Flask application, sets up routes, handles
 error responses, and manages user authentication using various methods.
 """
 import os
+import orjson
 from os import getenv
-from flask import Flask, jsonify, abort, request
-from flask_cors import (CORS, cross_origin)
+from flask import Flask, Response, abort, request, make_response
 
 from api.v1.views import app_views
 from api.v1.auth.auth import Auth
@@ -23,22 +23,52 @@ app = Flask(__name__)
 # Register the blueprint containing the views
 app.register_blueprint(app_views)
 
-# Enable Cross-Origin Resource Sharing (CORS) for API routes
-CORS(app, resources={r"/api/v1/*": {"origins": "*"}})
+# Error bodies are static, so they are serialized once at import
+_NOT_FOUND = orjson.dumps({"error": "Not found"})
+_UNAUTHORIZED = orjson.dumps({"error": "Unauthorized"})
+_FORBIDDEN = orjson.dumps({"error": "Forbidden"})
+
+# Paths excluded from authentication
+_EXCLUDED = (
+    "/api/v1/status/",  # Status check endpoint
+    "/api/v1/unauthorized/",  # Simulates unauthorized access
+    "/api/v1/forbidden/",  # Simulates forbidden access
+    "/api/v1/auth_session/login/",  # Login endpoint
+)
+# Excluded paths with and without their trailing slash, for a direct lookup
+_EXCLUDED_SET = frozenset(_EXCLUDED) | frozenset(
+    path.rstrip('/') for path in _EXCLUDED)
+
+# Authentication classes selectable with the AUTH_TYPE environment variable
+_AUTH_TABLE = {
+    'auth': Auth,  # Default authentication
+    'basic_auth': BasicAuth,  # Basic authentication
+    'session_auth': SessionAuth,  # Session-based authentication
+    'session_exp_auth': SessionExpAuth,  # Expiring sessions
+    'session_db_auth': SessionDBAuth,  # Database-stored sessions
+}
 
 # Set up authentication based on the AUTH_TYPE environment variable
 auth = None
 auth_type = getenv('AUTH_TYPE', 'auth')
-if auth_type == 'auth':
-    auth = Auth()  # Default authentication
-if auth_type == 'basic_auth':
-    auth = BasicAuth()  # Basic authentication
-if auth_type == 'session_auth':
-    auth = SessionAuth()  # Session-based authentication
-if auth_type == 'session_exp_auth':
-    auth = SessionExpAuth()  # Session-based authentication with expiration
-if auth_type == 'session_db_auth':
-    auth = SessionDBAuth()  # Session-based authentication with database storage
+auth_class = _AUTH_TABLE.get(auth_type)
+if auth_class is not None:
+    auth = auth_class()
+    auth.excluded_paths = _EXCLUDED  # Compile the excluded paths once
+
+
+def _json_response(body: bytes, status: int = 200) -> Response:
+    """
+    Wrap a serialized JSON body in a response.
+
+    Parameters:
+        - body (bytes): The JSON-encoded response body.
+        - status (int): The HTTP status code.
+
+    Returns:
+        - Response: A response with the `application/json` mimetype.
+    """
+    return Response(body, status=status, mimetype='application/json')
 
 
 @app.errorhandler(404)
@@ -49,7 +79,7 @@ def not_found(error) -> str:
     Returns:
         - JSON response with an error message and a 404 status code.
     """
-    return jsonify({"error": "Not found"}), 404
+    return _json_response(_NOT_FOUND, 404)
 
 
 @app.errorhandler(401)
@@ -60,7 +90,7 @@ def unauthorized(error) -> str:
     Returns:
         - JSON response with an error message and a 401 status code.
     """
-    return jsonify({"error": "Unauthorized"}), 401
+    return _json_response(_UNAUTHORIZED, 401)
 
 
 @app.errorhandler(403)
@@ -71,7 +101,42 @@ def forbidden(error) -> str:
     Returns:
         - JSON response with an error message and a 403 status code.
     """
-    return jsonify({"error": "Forbidden"}), 403
+    return _json_response(_FORBIDDEN, 403)
+
+
+@app.before_request
+def cors_preflight():
+    """
+    Answer CORS preflight requests for API routes.
+
+    Runs before authentication so that `OPTIONS` requests, which carry no
+    credentials, are not rejected.
+
+    Returns:
+        - An empty 204 response for `OPTIONS` requests on API routes.
+    """
+    if request.method == 'OPTIONS' and request.path.startswith('/api/v1/'):
+        return make_response('', 204)
+
+
+@app.after_request
+def cors_headers(response):
+    """
+    Enable Cross-Origin Resource Sharing (CORS) for API routes.
+
+    Allows any origin, which is the only policy the API uses, so the
+    headers are set directly instead of through Flask-CORS.
+
+    Returns:
+        - The response with the CORS headers added.
+    """
+    if request.path.startswith('/api/v1/'):
+        headers = response.headers
+        headers['Access-Control-Allow-Origin'] = '*'
+        headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
+        headers['Access-Control-Allow-Methods'] = \
+            'GET, POST, PUT, DELETE, OPTIONS'
+    return response
 
 
 @app.before_request
@@ -87,26 +152,22 @@ def authenticate_user():
     If no valid credentials are provided, it aborts the request with a 401 error.
     If the user is not authorized, it aborts the request with a 403 error.
     """
-    if auth:
-        # Paths excluded from authentication
-        excluded_paths = [
-            "/api/v1/status/",  # Status check endpoint
-            "/api/v1/unauthorized/",  # Simulates unauthorized access
-            "/api/v1/forbidden/",  # Simulates forbidden access
-            "/api/v1/auth_session/login/",  # Login endpoint
-        ]
-        if auth.require_auth(request.path, excluded_paths):
-            # Retrieve the current user
-            user = auth.current_user(request)
-            if auth.authorization_header(request) is None and \
-                    auth.session_cookie(request) is None:
-                # No credentials provided
-                abort(401)
-            if user is None:
-                # User is not authorized
-                abort(403)
-            # Attach the user object to the request for further use
-            request.current_user = user
+    path = request.path
+    if auth is None or not path.startswith('/api/v1/'):
+        return  # Only API routes are protected; anything else is a 404
+    if path in _EXCLUDED_SET or not auth.require_auth(path, _EXCLUDED):
+        return
+    if auth.authorization_header(request) is None and \
+            auth.session_cookie(request) is None:
+        # No credentials provided
+        abort(401)
+    # Retrieve the current user
+    user = auth.current_user(request)
+    if user is None:
+        # User is not authorized
+        abort(403)
+    # Attach the user object to the request for further use
+    request.current_user = user
 
 
 if __name__ == "__main__":
@@ -9,16 +9,54 @@ determine the current user.
 """
 import os
 import re
-from typing import List, TypeVar
+from typing import List, Tuple, TypeVar
 from flask import request
 
 
+SESSION_NAME = os.getenv('SESSION_NAME')
+
+
 class Auth:
     """Authentication class.
 
     This base class defines common authentication behaviors that can be extended
     by other classes to implement specific authentication mechanisms.
     """
+    _excluded_paths = None
+    _exact_paths = frozenset()
+    _wildcard_re = None
+
+    @property
+    def excluded_paths(self) -> Tuple[str, ...]:
+        """
+        The paths that do not require authentication.
+        """
+        return self._excluded_paths
+
+    @excluded_paths.setter
+    def excluded_paths(self, value: List[str]) -> None:
+        """
+        Precompiles the excluded paths used by `require_auth`.
+
+        Parameters:
+            - value (List[str]): A list of paths that do not require
+              authentication. Paths ending with `*` are matched as
+              prefixes.
+        """
+        exact_paths, wildcards = set(), []
+        for exclusion_path in map(lambda x: x.strip(), value or ()):
+            if not exclusion_path:
+                continue
+            if exclusion_path[-1] == '*':
+                wildcards.append(re.escape(exclusion_path[0:-1]))
+            else:
+                exact_paths.add(exclusion_path.rstrip('/'))
+        self._exact_paths = frozenset(exact_paths)
+        self._wildcard_re = None
+        if wildcards:
+            self._wildcard_re = re.compile('|'.join(wildcards))
+        self._excluded_paths = tuple(value or ())
+
     def require_auth(self, path: str, excluded_paths: List[str]) -> bool:
         """
         Determines if a given path requires authentication.
@@ -34,17 +72,15 @@ class Auth:
             - Paths ending with `*` will match any subpath.
             - A trailing `/` will match paths without further subpaths.
         """
-        if path is not None and excluded_paths is not None:
-            for exclusion_path in map(lambda x: x.strip(), excluded_paths):
-                pattern = ''
-                if exclusion_path[-1] == '*':
-                    pattern = '{}.*'.format(exclusion_path[0:-1])
-                elif exclusion_path[-1] == '/':
-                    pattern = '{}/*'.format(exclusion_path[0:-1])
-                else:
-                    pattern = '{}/*'.format(exclusion_path)
-                if re.match(pattern, path):
-                    return False
+        if path is None or excluded_paths is None:
+            return True
+        if excluded_paths is not self._excluded_paths and \
+                tuple(excluded_paths) != self._excluded_paths:
+            self.excluded_paths = excluded_paths
+        if path.rstrip('/') in self._exact_paths:
+            return False
+        if self._wildcard_re is not None and self._wildcard_re.match(path):
+            return False
         return True
 
     def authorization_header(self, request=None) -> str:
@@ -84,5 +120,4 @@ class Auth:
             - str: The value of the session cookie if present, None otherwise.
         """
         if request is not None:
-            cookie_name = os.getenv('SESSION_NAME')
-            return request.cookies.get(cookie_name)
+            return request.cookies.get(SESSION_NAME)
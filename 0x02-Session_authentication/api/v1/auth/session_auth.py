@@ -5,12 +5,12 @@ Module of session authenticating views.
 This module provides views for user authentication via session-based
 mechanisms, including login and logout endpoints.
 """
-import os
 from typing import Tuple
 from flask import abort, jsonify, request
 
 from models.user import User
 from api.v1.views import app_views
+from api.v1.auth.auth import SESSION_NAME
 
 
 @app_views.route('/auth_session/login', methods=['POST'], strict_slashes=False)
@@ -29,12 +29,14 @@ def login() -> Tuple[str, int]:
         - 400 if email or password is missing or invalid.
         - 404 if no user is found for the provided email.
         - 401 if the password is incorrect.
+        - 503 if the session could not be stored.
     """
     not_found_res = {"error": "no user found for this email"}
-    email = request.form.get('email')
+    form = request.form
+    email = form.get('email')
     if email is None or len(email.strip()) == 0:
         return jsonify({"error": "email missing"}), 400
-    password = request.form.get('password')
+    password = form.get('password')
     if password is None or len(password.strip()) == 0:
         return jsonify({"error": "password missing"}), 400
     try:
@@ -46,8 +48,10 @@ def login() -> Tuple[str, int]:
     if users[0].is_valid_password(password):
         from api.v1.app import auth
         sessiond_id = auth.create_session(getattr(users[0], 'id'))
+        if sessiond_id is None:
+            return jsonify({"error": "session storage unavailable"}), 503
         res = jsonify(users[0].to_json())
-        res.set_cookie(os.getenv("SESSION_NAME"), sessiond_id)
+        res.set_cookie(SESSION_NAME, sessiond_id)
         return res
     return jsonify({"error": "wrong password"}), 401
 
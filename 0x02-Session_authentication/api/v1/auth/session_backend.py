@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Session storage backends module for the API.
+
+This module defines the `SessionBackend` interface that `SessionExpAuth`
+uses to keep sessions outside of the process, so that they are shared by
+every worker of the app, and a memcached implementation of it.
+"""
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+# memcached reads expiration times above 30 days as absolute Unix times
+_MEMCACHED_MAX_RELATIVE_TTL = 30 * 24 * 60 * 60
+# memcached keys are at most 250 bytes with no whitespace or control chars
+_MEMCACHED_KEY = re.compile(r'[\x21-\x7e]{1,250}')
+
+
+class SessionBackend(ABC):
+    """Session store interface.
+
+    Implementations expire entries on their own once their TTL has passed.
+    """
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[dict]:
+        """
+        Retrieves the session details stored for a session ID.
+
+        Parameters:
+            - session_id (str): The session ID to look up.
+
+        Returns:
+            - dict: The session details, or None if missing or expired.
+        """
+        ...
+
+    @abstractmethod
+    def set(self, session_id: str, value: dict, ttl: int = 0) -> bool:
+        """
+        Stores the session details for a session ID.
+
+        Parameters:
+            - session_id (str): The session ID to store.
+            - value (dict): The session details.
+            - ttl (int): Seconds before the session expires, 0 for never.
+
+        Returns:
+            - bool: True if the session was stored, False otherwise.
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """
+        Removes the session details stored for a session ID.
+
+        Parameters:
+            - session_id (str): The session ID to remove.
+        """
+        ...
+
+
+class _MsgpackSerde:
+    """pymemcache serializer storing values as msgpack."""
+
+    def __init__(self, msgpack) -> None:
+        """
+        Initializes the serializer with the `msgpack` module.
+        """
+        self._msgpack = msgpack
+
+    def serialize(self, key, value):
+        """
+        Encodes a value for memcached.
+        """
+        return self._msgpack.packb(value), 1
+
+    def deserialize(self, key, value, flags):
+        """
+        Decodes a value read from memcached.
+        """
+        return self._msgpack.unpackb(value)
+
+
+class MemcachedBackend(SessionBackend):
+    """Session store backed by memcached.
+
+    Requires the `pymemcache` and `msgpack` packages. Session IDs that
+    are not valid memcached keys are never stored, and a server that is
+    unreachable or does not answer within `timeout` seconds is treated as
+    a cache miss.
+    """
+
+    def __init__(
+            self, host: str = '127.0.0.1', port: int = 11211,
+            max_pool_size: int = 32, timeout: float = 0.5) -> None:
+        """
+        Initializes a pooled client to the memcached server.
+
+        Parameters:
+            - host (str): The memcached server host.
+            - port (int): The memcached server port.
+            - max_pool_size (int): The maximum number of pooled connections.
+            - timeout (float): Seconds to wait when connecting to or
+              reading from the server.
+        """
+        import msgpack
+        from pymemcache.client.base import PooledClient
+        from pymemcache.exceptions import MemcacheError
+        self._errors = (MemcacheError, OSError)
+        self._client = PooledClient(
+            (host, port),
+            serde=_MsgpackSerde(msgpack),
+            max_pool_size=max_pool_size,
+            connect_timeout=timeout,
+            timeout=timeout,
+        )
+
+    def get(self, session_id: str) -> Optional[dict]:
+        """
+        Retrieves the session details stored for a session ID.
+        """
+        if not _valid_key(session_id):
+            return None
+        try:
+            return self._client.get(session_id)
+        except self._errors:
+            return None
+
+    def set(self, session_id: str, value: dict, ttl: int = 0) -> bool:
+        """
+        Stores the session details for a session ID.
+        """
+        if not _valid_key(session_id):
+            return False
+        if ttl > _MEMCACHED_MAX_RELATIVE_TTL:
+            ttl = int(time.time()) + ttl
+        try:
+            return self._client.set(
+                session_id, value, expire=max(ttl, 0), noreply=False)
+        except self._errors:
+            return False
+
+    def delete(self, session_id: str) -> None:
+        """
+        Removes the session details stored for a session ID.
+        """
+        if not _valid_key(session_id):
+            return
+        try:
+            self._client.delete(session_id)
+        except self._errors:
+            pass
+
+
+def _valid_key(session_id) -> bool:
+    """
+    Checks that a session ID can be used as a memcached key.
+    """
+    return (isinstance(session_id, str)
+            and _MEMCACHED_KEY.fullmatch(session_id) is not None)
+
+
+def backend_from_env() -> Optional[SessionBackend]:
+    """
+    Creates the session backend configured by the environment.
+
+    Uses memcached when `SESSION_MEMCACHED` is set to a `host:port` address,
+    waiting at most `SESSION_MEMCACHED_TIMEOUT` seconds (default 0.5) for it.
+
+    Returns:
+        - SessionBackend: The configured backend, or None to keep sessions
+          in the process.
+    """
+    server = os.getenv('SESSION_MEMCACHED')
+    if not server:
+        return None
+    host, _, port = server.partition(':')
+    timeout = float(os.getenv('SESSION_MEMCACHED_TIMEOUT', '0.5'))
+    return MemcachedBackend(
+        host or '127.0.0.1', int(port or 11211), timeout=timeout)
@@ -6,11 +6,17 @@ This module extends `SessionExpAuth` to include persistent storage of session
 data in a database. It uses the `UserSession` model to store and manage session
 details such as session IDs and associated user information.
 """
+import os
+from time import time
+from threading import RLock
+from cachetools import TLRUCache
 from flask import request
-from datetime import datetime, timedelta
 
 from models.user_session import UserSession
-from .session_exp_auth import SessionExpAuth
+from .session_exp_auth import SessionExpAuth, _new_session_id
+
+# Seconds a cached session is trusted before the database is checked again
+_CACHE_TTL = 60
 
 
 class SessionDBAuth(SessionExpAuth):
@@ -20,6 +26,36 @@ class SessionDBAuth(SessionExpAuth):
     information in a database using the `UserSession` model.
     """
 
+    _use_backend = False  # Sessions are stored in the database
+
+    def __init__(self) -> None:
+        """
+        Initializes a new SessionDBAuth instance.
+
+        Attributes:
+            - _cache (TLRUCache): In-process index of at most `SESSION_MAX`
+              (default 100000) session IDs to a
+              `(user_id, created_ts, record_id)` tuple, filled on creation or
+              first lookup. `created_ts` is the session's `created_at` as a
+              POSIX timestamp and `record_id` the `UserSession` object's ID.
+              Each entry is dropped once its session expires, or after
+              `_CACHE_TTL` seconds so that sessions removed from the
+              database by another process stop working soon after.
+        """
+        super().__init__()
+        self._cache = TLRUCache(
+            maxsize=int(os.getenv('SESSION_MAX', '100000')),
+            ttu=self._session_expiry,
+            timer=time,
+        )
+        self._cache_lock = RLock()  # TLRUCache is not thread-safe
+
+    def _session_expiry(self, session_id, entry, now) -> float:
+        """
+        Returns the POSIX time at which a cached session expires.
+        """
+        return min(entry[1] + self.session_duration, now + _CACHE_TTL)
+
     def create_session(self, user_id=None) -> str:
         """
         Creates and stores a session ID for a user in the database.
@@ -32,15 +68,21 @@ class SessionDBAuth(SessionExpAuth):
 
         Behavior:
             - Stores the session ID and user ID in the database for persistence.
+            - Skips the in-process store of `SessionExpAuth`, which lookups
+              here never read.
         """
-        session_id = super().create_session(user_id)
-        if type(session_id) == str:
+        if isinstance(user_id, str):
+            session_id = _new_session_id()
             kwargs = {
                 'user_id': user_id,
                 'session_id': session_id,
             }
             user_session = UserSession(**kwargs)
             user_session.save()
+            created_ts = user_session.created_at.timestamp()
+            with self._cache_lock:
+                self._cache[session_id] = (
+                    user_id, created_ts, user_session.id)
             return session_id
 
     def user_id_for_session_id(self, session_id=None):
@@ -54,21 +96,28 @@ class SessionDBAuth(SessionExpAuth):
             - str: The user ID if the session is valid, None otherwise.
 
         Behavior:
+            - Looks the session up in `_cache` first and only searches the
+              database on a miss, caching what it finds.
             - Checks the session expiration using the `created_at` timestamp
               and the session duration.
             - If the session has expired or is not found, None is returned.
         """
+        with self._cache_lock:
+            entry = self._cache.get(session_id)
+        if entry is not None:
+            return entry[0]  # Expired entries are never returned
         try:
             sessions = UserSession.search({'session_id': session_id})
         except Exception:
             return None
         if len(sessions) <= 0:
             return None
-        cur_time = datetime.now()
-        time_span = timedelta(seconds=self.session_duration)
-        exp_time = sessions[0].created_at + time_span
-        if exp_time < cur_time:
+        created_ts = sessions[0].created_at.timestamp()
+        if time() - created_ts > self.session_duration:
             return None
+        with self._cache_lock:
+            self._cache[session_id] = (
+                sessions[0].user_id, created_ts, sessions[0].id)
         return sessions[0].user_id
 
     def destroy_session(self, request=None) -> bool:
@@ -83,15 +132,25 @@ class SessionDBAuth(SessionExpAuth):
 
         Behavior:
             - Removes the session record from the database using the session ID
-              extracted from the request.
+              extracted from the request, loading it by its cached record ID
+              when available instead of searching.
             - Returns False if the session does not exist or an error occurs.
         """
         session_id = self.session_cookie(request)
-        try:
-            sessions = UserSession.search({'session_id': session_id})
-        except Exception:
-            return False
-        if len(sessions) <= 0:
+        if not session_id:
             return False
-        sessions[0].remove()
+        with self._cache_lock:
+            entry = self._cache.pop(session_id, None)
+        user_session = None
+        if entry is not None:
+            user_session = UserSession.get(entry[2])
+        if user_session is None:
+            try:
+                sessions = UserSession.search({'session_id': session_id})
+            except Exception:
+                return False
+            if len(sessions) <= 0:
+                return False
+            user_session = sessions[0]
+        user_session.remove()
         return True
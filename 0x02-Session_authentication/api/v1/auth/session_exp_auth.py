@@ -5,10 +5,23 @@ This module extends the `SessionAuth` class to include session expiration functi
 allowing sessions to expire after a configurable duration.
 """
 import os
+import secrets
+from threading import RLock
+from cachetools import TTLCache
 from flask import request
-from datetime import datetime, timedelta
 
 from .session_auth import SessionAuth
+from .session_backend import backend_from_env
+
+
+def _new_session_id() -> str:
+    """
+    Generates a new random session ID.
+
+    Returns:
+        - str: 16 random bytes, URL-safe Base64-encoded (22 characters).
+    """
+    return secrets.token_urlsafe(16)
 
 
 class SessionExpAuth(SessionAuth):
@@ -18,6 +31,8 @@ class SessionExpAuth(SessionAuth):
     Sessions can be configured to expire after a specified duration.
     """
 
+    _use_backend = True  # Subclasses with their own store turn this off
+
     def __init__(self) -> None:
         """
         Initializes a new SessionExpAuth instance.
@@ -25,12 +40,25 @@ class SessionExpAuth(SessionAuth):
         Attributes:
             - session_duration (int): The duration (in seconds) for which a session is valid.
               Defaults to 0, indicating no expiration.
+            - session_backend (SessionBackend): The shared store holding the
+              sessions, or None to keep them in `user_id_by_session_id`.
+            - user_id_by_session_id (TTLCache): When sessions expire, a cache
+              of at most `SESSION_MAX` (default 100000) sessions that drops
+              them once session_duration has elapsed.
         """
         super().__init__()
         try:
             self.session_duration = int(os.getenv('SESSION_DURATION', '0'))
         except Exception:
             self.session_duration = 0
+        self.session_backend = (
+            backend_from_env() if self._use_backend else None)
+        self._lock = RLock()  # Guards user_id_by_session_id
+        if self.session_duration > 0:
+            self.user_id_by_session_id = TTLCache(
+                maxsize=int(os.getenv('SESSION_MAX', '100000')),
+                ttl=self.session_duration,
+            )
 
     def create_session(self, user_id=None):
         """
@@ -40,19 +68,21 @@ class SessionExpAuth(SessionAuth):
             - user_id (str): The ID of the user to create a session for.
 
         Returns:
-            - str: The session ID if successfully created, None otherwise.
+            - str: The session ID if successfully created, None otherwise,
+              including when the session backend fails to store it.
 
-        Session details include:
-            - user_id: The associated user's ID.
-            - created_at: The timestamp when the session was created.
+        The user ID is stored under the session ID; expiration is left to
+        `user_id_by_session_id` or to the session backend.
         """
-        session_id = super().create_session(user_id)
-        if type(session_id) != str:
+        if not isinstance(user_id, str):
             return None
-        self.user_id_by_session_id[session_id] = {
-            'user_id': user_id,
-            'created_at': datetime.now(),
-        }
+        session_id = _new_session_id()
+        if self.session_backend is not None:
+            stored = self.session_backend.set(
+                session_id, {'user_id': user_id}, self.session_duration)
+            return session_id if stored else None
+        with self._lock:
+            self.user_id_by_session_id[session_id] = user_id
         return session_id
 
     def user_id_for_session_id(self, session_id=None) -> str:
@@ -69,16 +99,33 @@ class SessionExpAuth(SessionAuth):
             - If session_duration is 0 or less, the session does not expire.
             - If the session has expired, None is returned.
         """
-        if session_id in self.user_id_by_session_id:
-            session_dict = self.user_id_by_session_id[session_id]
-            if self.session_duration <= 0:
-                return session_dict['user_id']
-            if 'created_at' not in session_dict:
-                return None
-            cur_time = datetime.now()
-            time_span = timedelta(seconds=self.session_duration)
-            exp_time = session_dict['created_at'] + time_span
-            if exp_time < cur_time:
+        if self.session_backend is not None:
+            if session_id is None:
                 return None
-            return session_dict['user_id']
+            session_dict = self.session_backend.get(session_id)
+            return None if session_dict is None else session_dict['user_id']
+        with self._lock:
+            return self.user_id_by_session_id.get(session_id)
 
+    def destroy_session(self, request=None) -> bool:
+        """
+        Destroys an authenticated session.
+
+        Parameters:
+            - request (flask.Request): The HTTP request containing the
+              session cookie.
+
+        Returns:
+            - bool: True if the session was successfully destroyed,
+              False otherwise.
+        """
+        if self.session_backend is None:
+            with self._lock:
+                return super().destroy_session(request)
+        session_id = self.session_cookie(request)
+        if session_id is None:
+            return False
+        if self.user_id_for_session_id(session_id) is None:
+            return False
+        self.session_backend.delete(session_id)
+        return True
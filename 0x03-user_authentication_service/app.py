@@ -1,99 +1,216 @@
 #!/usr/bin/env python3
 """A simple Flask app with user authentication."""
 
-from flask import Flask, jsonify, request, abort, redirect
+from threading import Lock, RLock
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl
+
+import orjson
+from cachetools import TTLCache
+from flask import Flask, Response, request, abort, redirect
 from auth import Auth
 
 app = Flask(__name__)
-AUTH = Auth()
+app.url_map.strict_slashes = False
+# Forms here hold a few short fields; larger bodies are rejected with a 413
+app.config["MAX_CONTENT_LENGTH"] = 16 * 1024
+_AUTH = None
+_AUTH_LOCK = Lock()
+_USER_CACHE = TTLCache(maxsize=10_000, ttl=60)
+# email -> IDs of the sessions cached for that user in _USER_CACHE
+_SESSIONS_BY_EMAIL = TTLCache(maxsize=10_000, ttl=60)
+# email -> value of _FORGET_GENERATION when the user was last forgotten
+_FORGOTTEN_AT: Dict[str, int] = {}
+_FORGET_GENERATION = 0
+_USER_CACHE_LOCK = RLock()  # Guards the caches and generations
+_MISS = object()
+_WELCOME = orjson.dumps({"message": "Bienvenue"})
+_EMAIL_TAKEN = orjson.dumps({"message": "email already registered"})
+
+def get_auth() -> Auth:
+    """Return the shared Auth instance, creating it on first use."""
+    global _AUTH
+    if _AUTH is None:
+        with _AUTH_LOCK:
+            if _AUTH is None:  # Another thread may have created it
+                _AUTH = Auth()
+    return _AUTH
+
+@app.teardown_request
+def remove_session(exception=None) -> None:
+    """Return the request's DB session to the connection pool."""
+    if _AUTH is not None:
+        _AUTH._db.remove_session()
+
+def _json(obj, status: int = 200) -> Response:
+    """Return a JSON response, serializing non-bytes bodies with orjson."""
+    body = obj if isinstance(obj, bytes) else orjson.dumps(obj)
+    return Response(body, status=status, mimetype="application/json")
+
+def _form(keys: Tuple[str, ...]) -> List[Optional[str]]:
+    """Return the values of the given form fields, None if missing.
+
+    URL-encoded bodies are parsed directly, skipping Werkzeug's form parser,
+    once their declared length is checked against MAX_CONTENT_LENGTH.
+    """
+    if request.mimetype != "application/x-www-form-urlencoded":
+        form = request.form
+        return [form.get(key) for key in keys]
+    length = request.content_length
+    if length is not None and length > app.config["MAX_CONTENT_LENGTH"]:
+        abort(413)
+    body = request.get_data(cache=False, as_text=True)
+    try:
+        pairs = parse_qsl(body, keep_blank_values=True, max_num_fields=8)
+    except ValueError:
+        abort(400)
+    fields = dict(reversed(pairs))  # First value wins, as with request.form
+    return [fields.get(key) for key in keys]
+
+def _get_user_cached(session_id: str) -> Optional[Tuple[int, str]]:
+    """Return the (id, email) of a session's user, caching the result.
+
+    Missing sessions are cached too, as None. A user read while
+    _forget_user ran for them is returned but not cached, since their
+    session may have been replaced or destroyed meanwhile.
+    """
+    if session_id is None:
+        return None
+    with _USER_CACHE_LOCK:
+        cached = _USER_CACHE.get(session_id, _MISS)
+        generation = _FORGET_GENERATION
+    if cached is not _MISS:
+        return cached
+    user = get_auth().get_user_from_session_id(session_id)
+    cached = None if user is None else (user.id, user.email)
+    with _USER_CACHE_LOCK:
+        if (cached is not None
+                and _FORGOTTEN_AT.get(cached[1], 0) > generation):
+            return cached  # Forgotten during the lookup, do not cache
+        _USER_CACHE[session_id] = cached
+        if cached is not None:
+            sessions: Set[str] = _SESSIONS_BY_EMAIL.get(cached[1], set())
+            sessions.add(session_id)
+            # Reinserting renews the TTL, so it outlives the entries it lists
+            _SESSIONS_BY_EMAIL[cached[1]] = sessions
+    return cached
+
+def _forget_user(email: str) -> None:
+    """Drop every cached session of the user with the given email."""
+    global _FORGET_GENERATION
+    with _USER_CACHE_LOCK:
+        _FORGET_GENERATION += 1
+        _FORGOTTEN_AT[email] = _FORGET_GENERATION
+        for sid in _SESSIONS_BY_EMAIL.pop(email, ()):
+            _USER_CACHE.pop(sid, None)  # May have expired already
 
-@app.route("/", methods=["GET"], strict_slashes=False)
 def index() -> str:
     """GET /
     Return:
         - Welcome message.
     """
-    return jsonify({"message": "Bienvenue"})
+    return _json(_WELCOME)
 
-@app.route("/users", methods=["POST"], strict_slashes=False)
 def users() -> str:
     """POST /users
     Return:
         - Account creation response.
     """
-    email, password = request.form.get("email"), request.form.get("password")
+    email, password = _form(("email", "password"))
+    if not email or not password:
+        abort(400)
     try:
-        AUTH.register_user(email, password)
-        return jsonify({"email": email, "message": "user created"})
+        get_auth().register_user(email, password)
+        return _json({"email": email, "message": "user created"})
     except ValueError:
-        return jsonify({"message": "email already registered"}), 400
+        return _json(_EMAIL_TAKEN, 400)
 
-@app.route("/sessions", methods=["POST"], strict_slashes=False)
 def login() -> str:
     """POST /sessions
     Return:
         - Login response with session ID.
     """
-    email, password = request.form.get("email"), request.form.get("password")
-    if not AUTH.valid_login(email, password):
+    email, password = _form(("email", "password"))
+    if not email or not password:
+        abort(401)
+    if not get_auth().valid_login(email, password):
         abort(401)
-    session_id = AUTH.create_session(email)
-    response = jsonify({"email": email, "message": "logged in"})
+    session_id = get_auth().create_session(email)
+    _forget_user(email)  # The user's previous session is no longer valid
+    response = _json({"email": email, "message": "logged in"})
     response.set_cookie("session_id", session_id)
     return response
 
-@app.route("/sessions", methods=["DELETE"], strict_slashes=False)
 def logout() -> str:
     """DELETE /sessions
     Return:
-        - Redirect to home after logout.
+        - Redirect to home after logout, as before, for clients that
+          prefer HTML or send no Accept header; otherwise an empty 204.
     """
     session_id = request.cookies.get("session_id")
-    user = AUTH.get_user_from_session_id(session_id)
+    user = _get_user_cached(session_id)
     if user is None:
         abort(403)
-    AUTH.destroy_session(user.id)
-    return redirect("/")
+    get_auth().destroy_session(user[0])
+    _forget_user(user[1])
+    accept = request.accept_mimetypes
+    preferred = accept.best_match(["text/html", "application/json"])
+    if not accept or preferred == "text/html":
+        return redirect("/")
+    return Response(status=204)
 
-@app.route("/profile", methods=["GET"], strict_slashes=False)
 def profile() -> str:
     """GET /profile
     Return:
         - User profile information.
     """
     session_id = request.cookies.get("session_id")
-    user = AUTH.get_user_from_session_id(session_id)
+    user = _get_user_cached(session_id)
     if user is None:
         abort(403)
-    return jsonify({"email": user.email})
+    return _json({"email": user[1]})
 
-@app.route("/reset_password", methods=["POST"], strict_slashes=False)
 def get_reset_password_token() -> str:
     """POST /reset_password
     Return:
         - Password reset token.
     """
-    email = request.form.get("email")
+    email = _form(("email",))[0]
     try:
-        reset_token = AUTH.get_reset_password_token(email)
+        reset_token = get_auth().get_reset_password_token(email)
     except ValueError:
         abort(403)
-    return jsonify({"email": email, "reset_token": reset_token})
+    return _json({"email": email, "reset_token": reset_token})
 
-@app.route("/reset_password", methods=["PUT"], strict_slashes=False)
 def update_password() -> str:
     """PUT /reset_password
     Return:
         - Response after password update.
     """
-    email = request.form.get("email")
-    reset_token = request.form.get("reset_token")
-    new_password = request.form.get("new_password")
+    email, reset_token, new_password = _form(
+        ("email", "reset_token", "new_password"))
     try:
-        AUTH.update_password(reset_token, new_password)
+        get_auth().update_password(reset_token, new_password)
     except ValueError:
         abort(403)
-    return jsonify({"email": email, "message": "Password updated"})
+    return _json({"email": email, "message": "Password updated"})
+
+# Routes skip Flask's automatic OPTIONS handling
+app.add_url_rule("/", "index", index, methods=["GET"],
+                 provide_automatic_options=False)
+app.add_url_rule("/users", "users", users, methods=["POST"],
+                 provide_automatic_options=False)
+app.add_url_rule("/sessions", "login", login, methods=["POST"],
+                 provide_automatic_options=False)
+app.add_url_rule("/sessions", "logout", logout, methods=["DELETE"],
+                 provide_automatic_options=False)
+app.add_url_rule("/profile", "profile", profile, methods=["GET"],
+                 provide_automatic_options=False)
+app.add_url_rule("/reset_password", "get_reset_password_token",
+                 get_reset_password_token, methods=["POST"],
+                 provide_automatic_options=False)
+app.add_url_rule("/reset_password", "update_password", update_password,
+                 methods=["PUT"], provide_automatic_options=False)
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port="5000")
@@ -4,9 +4,10 @@
 from sqlalchemy import create_engine, tuple_
 from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import QueuePool
 
 from user import Base, User
 
@@ -16,18 +17,29 @@ class DB:
 
     def __init__(self) -> None:
         """Initialize DB engine and setup tables."""
-        self._engine = create_engine("sqlite:///a.db", echo=False)
+        self._engine = create_engine(
+            "sqlite:///a.db",
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=20,
+            max_overflow=10,
+            pool_recycle=1800,
+            pool_pre_ping=True,
+            connect_args={"check_same_thread": False},
+        )
         Base.metadata.drop_all(self._engine)
         Base.metadata.create_all(self._engine)
-        self.__session = None
+        self._Session = scoped_session(
+            sessionmaker(bind=self._engine, expire_on_commit=False))
 
     @property
     def _session(self) -> Session:
-        """Return a cached session instance."""
-        if self.__session is None:
-            DBSession = sessionmaker(bind=self._engine)
-            self.__session = DBSession()
-        return self.__session
+        """Return the current thread's session instance."""
+        return self._Session()
+
+    def remove_session(self) -> None:
+        """Close the thread's session, returning its connection to the pool."""
+        self._Session.remove()
 
     def add_user(self, email: str, hashed_password: str) -> User:
         """Add a new user to the DB."""
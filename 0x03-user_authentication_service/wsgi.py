@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""ASGI entry point for serving the app under an event loop.
+
+Run from this directory in a single worker, for example:
+    uvicorn --loop uvloop --workers 1 --limit-concurrency 1000 wsgi:asgi_app
+
+asgiref's WsgiToAsgi runs every WSGI call on one shared thread, so it
+would serve requests one at a time. asgi_app instead runs each call on a
+pool of `WSGI_THREADS` threads (default 32), so DB queries and bcrypt
+checks of different requests overlap. Do not start several workers: the
+tables are recreated when each process first builds its DB, and the
+session user cache is local to the process.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+
+from app import app
+
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("WSGI_THREADS", "32")),
+    thread_name_prefix="wsgi",
+)
+
+class _ThreadedWsgiToAsgiInstance(WsgiToAsgiInstance):
+    """WSGI request handler running the app on a thread of _EXECUTOR."""
+
+    run_wsgi_app = sync_to_async(
+        WsgiToAsgiInstance.__dict__["run_wsgi_app"].func,
+        thread_sensitive=False,
+        executor=_EXECUTOR,
+    )
+
+class _ThreadedWsgiToAsgi(WsgiToAsgi):
+    """WsgiToAsgi that handles requests concurrently."""
+
+    async def __call__(self, scope, receive, send):
+        """Serve one ASGI connection with the wrapped WSGI app."""
+        instance = _ThreadedWsgiToAsgiInstance(self.wsgi_application)
+        await instance(scope, receive, send)
+
+asgi_app = _ThreadedWsgiToAsgi(app)